@@ -6,15 +6,344 @@ A modern GUI auto-clicker with customizable settings for macOS, Linux, and Windo
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import contextlib
+import ctypes
+import ctypes.util
+import functools
 import time
 import sys
 import platform
+from dataclasses import dataclass
+from typing import Callable
 
-try:
-    import pyautogui
-except ImportError:
-    pyautogui = None
+# pyautogui is heavy to import (PIL, pyscreeze, and an X server connection
+# on Linux), so it is only loaded once the user starts clicking.
+pyautogui = None
+
+# How often the click counter label is refreshed while clicking (~30 Hz)
+UI_REFRESH_MS = 33
+
+# The fail-safe corner check costs a cursor-position syscall, so the direct
+# click path checks at most once per FAILSAFE_CHECK_SECONDS (every click at
+# 10 CPS or slower)
+FAILSAFE_CHECK_SECONDS = 0.1
+
+# Burst mode (Windows only) sends up to BURST_SIZE clicks per SendInput call
+# once the click speed exceeds BURST_MIN_CPS
+BURST_SIZE = 16
+BURST_MIN_CPS = 30
+
+
+# QOS_CLASS_USER_INTERACTIVE from <sys/qos.h>
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+
+
+@contextlib.contextmanager
+def _high_res_timer():
+    """Reduce timer jitter for the Tk main thread during a clicking session.
+
+    - Windows: raise the timer resolution from 15.6 ms to 1 ms.
+    - macOS: mark the thread as user-interactive so it isn't coalesced,
+      restoring its previous QoS class when the session ends.
+
+    Clicks run on the GUI thread, so it is deliberately not given a
+    real-time policy such as SCHED_FIFO on Linux: a session that falls
+    behind would spin at real-time priority and starve the X server.
+    """
+    winmm = None
+    old_qos = None
+    if sys.platform == "win32":
+        try:
+            winmm = ctypes.windll.winmm
+            winmm.timeBeginPeriod(1)
+        except (AttributeError, OSError):
+            winmm = None
+    elif sys.platform == "darwin":
+        try:
+            libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib")
+            old_qos = libsystem.qos_class_self()
+            libsystem.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+        except (AttributeError, OSError):
+            old_qos = None
+    try:
+        yield
+    finally:
+        if winmm is not None:
+            winmm.timeEndPeriod(1)
+        if old_qos is not None:
+            libsystem.pthread_set_qos_class_self_np(old_qos, 0)
+
+
+# Win32 SendInput structures. MOUSEINPUT is the largest member of the
+# INPUT union, so it alone gives the struct its correct size.
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("mi", _MOUSEINPUT)]
+
+
+_INPUT_MOUSE = 0
+
+# (down, up) MOUSEEVENTF_* flags per button
+_WIN_BUTTON_FLAGS = {
+    "left": (0x0002, 0x0004),
+    "right": (0x0008, 0x0010),
+    "middle": (0x0020, 0x0040),
+}
+
+
+def _make_input_array(button, presses):
+    """Build an INPUT array holding alternating down/up events for presses."""
+    down, up = _WIN_BUTTON_FLAGS[button]
+    events = (_INPUT * (2 * presses))()
+    for i, event in enumerate(events):
+        event.type = _INPUT_MOUSE
+        event.mi.dwFlags = up if i % 2 else down
+    return events
+
+
+def _make_sendinput_clicks(button, presses):
+    """Build a Windows clicker that sends all presses in one SendInput call.
+
+    Without MOUSEEVENTF_MOVE the events land at the current cursor
+    position, so no coordinates are needed.
+    """
+    try:
+        send_input = ctypes.windll.user32.SendInput
+    except AttributeError:
+        return None
+    
+    events = _make_input_array(button, presses)
+    count = len(events)
+    size = ctypes.sizeof(_INPUT)
+    
+    def click():
+        send_input(count, events, size)
+    
+    return click
+
+
+def _make_quartz_clicks(button, presses):
+    """Build a macOS clicker that reuses one Quartz mouse event.
+
+    Quartz events need a location, which is read from a blank event
+    instead of going through pyautogui.position(). Each press carries an
+    increasing click state, which is how macOS applications recognise a
+    double click.
+    """
+    try:
+        import Quartz
+    except ImportError:
+        return None
+    
+    btn, down, up = {
+        "left": (Quartz.kCGMouseButtonLeft, Quartz.kCGEventLeftMouseDown,
+                 Quartz.kCGEventLeftMouseUp),
+        "right": (Quartz.kCGMouseButtonRight, Quartz.kCGEventRightMouseDown,
+                  Quartz.kCGEventRightMouseUp),
+        "middle": (Quartz.kCGMouseButtonCenter, Quartz.kCGEventOtherMouseDown,
+                   Quartz.kCGEventOtherMouseUp),
+    }[button]
+    event = Quartz.CGEventCreateMouseEvent(None, down, (0, 0), btn)
+    create_event = Quartz.CGEventCreate
+    get_location = Quartz.CGEventGetLocation
+    set_location = Quartz.CGEventSetLocation
+    set_field = Quartz.CGEventSetIntegerValueField
+    set_type = Quartz.CGEventSetType
+    post = Quartz.CGEventPost
+    tap = Quartz.kCGHIDEventTap
+    click_state = Quartz.kCGMouseEventClickState
+    
+    def click():
+        set_location(event, get_location(create_event(None)))
+        for state in range(1, presses + 1):
+            set_field(event, click_state, state)
+            set_type(event, down)
+            post(tap, event)
+            set_type(event, up)
+            post(tap, event)
+    
+    return click
+
+
+@functools.lru_cache(maxsize=None)
+def _open_x_display():
+    """Open the X display once, returning (xlib, xtst, display) or None."""
+    try:
+        xlib = ctypes.CDLL(ctypes.util.find_library("X11") or "libX11.so.6")
+        xtst = ctypes.CDLL(ctypes.util.find_library("Xtst") or "libXtst.so.6")
+    except OSError:
+        return None
+    
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XFlush.argtypes = [ctypes.c_void_p]
+    xtst.XTestFakeButtonEvent.argtypes = [
+        ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong
+    ]
+    
+    display = xlib.XOpenDisplay(None)
+    if not display:
+        return None
+    return xlib, xtst, display
+
+
+def _make_xtest_clicks(button, presses):
+    """Build an X11 clicker that sends XTest button events.
+
+    XTest clicks land wherever the pointer is, so there is no
+    XQueryPointer round trip per click.
+    """
+    x11 = _open_x_display()
+    if x11 is None:
+        return None
+    
+    xlib, xtst, display = x11
+    fake_button = xtst.XTestFakeButtonEvent
+    flush = xlib.XFlush
+    number = {"left": 1, "middle": 2, "right": 3}[button]
+    
+    def click():
+        for _ in range(presses):
+            fake_button(display, number, True, 0)
+            fake_button(display, number, False, 0)
+        flush(display)
+    
+    return click
+
+
+def _make_native_clicks(button, presses):
+    """Return an OS-native clicker for this platform, or None if unavailable."""
+    if sys.platform == "win32":
+        return _make_sendinput_clicks(button, presses)
+    if sys.platform == "darwin":
+        return _make_quartz_clicks(button, presses)
+    if sys.platform.startswith("linux"):
+        return _make_xtest_clicks(button, presses)
+    return None
+
+
+@dataclass(frozen=True)
+class _Backend:
+    """pyautogui's platform backend functions, resolved once per session."""
+    
+    __slots__ = ("down", "up", "pos")
+    
+    down: Callable
+    up: Callable
+    pos: Callable
+    
+    @classmethod
+    def resolve(cls):
+        """Look up the backend pyautogui selected for this platform."""
+        module = pyautogui.platformModule
+        return cls(down=module._mouseDown, up=module._mouseUp, pos=module._position)
+
+
+def _make_click_action(button, is_double, compat_mode):
+    """Build the callable that performs one (single or double) click.
+
+    The click type and mode never change during a session, so the choice
+    is made once here instead of on every click.
+    """
+    if compat_mode:
+        click = pyautogui.doubleClick if is_double else pyautogui.click
+        return functools.partial(click, button=button)
+    
+    # Call the platform backend directly, skipping pyautogui's argument
+    # handling, mouse move and pause logic
+    be = _Backend.resolve()
+    failsafe = pyautogui.FAILSAFE
+    failsafe_points = set(map(tuple, pyautogui.FAILSAFE_POINTS))
+    presses = 2 if is_double else 1
+    
+    # Prefer native OS clicks: they act at the current cursor position
+    # without looking it up, and a double click is delivered as one gesture
+    press = _make_native_clicks(button, presses)
+    if press is None:
+        # The backend needs the position anyway, so check it on every click
+        def fallback_click():
+            x, y = be.pos()
+            if failsafe and (x, y) in failsafe_points:
+                raise pyautogui.FailSafeException("Mouse moved to a fail-safe corner")
+            for _ in range(presses):
+                be.down(x, y, button)
+                be.up(x, y, button)
+        
+        return fallback_click
+    
+    if not failsafe:
+        return press
+    
+    last_check = float('-inf')
+    
+    def do_click():
+        nonlocal last_check
+        now = time.perf_counter()
+        if now - last_check >= FAILSAFE_CHECK_SECONDS:
+            last_check = now
+            if tuple(be.pos()) in failsafe_points:
+                raise pyautogui.FailSafeException("Mouse moved to a fail-safe corner")
+        press()
+    
+    return do_click
+
+
+def _make_burst_action(button, is_double):
+    """Build the callable that sends ``n`` clicks in one SendInput call.
+
+    One system call per batch instead of per click trades pacing within
+    the batch for throughput. Only Windows supports this; elsewhere
+    None is returned. The fail-safe is checked once per batch.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        send_input = ctypes.windll.user32.SendInput
+    except AttributeError:
+        return None
+    
+    events_per_click = 4 if is_double else 2
+    events = _make_input_array(button, BURST_SIZE * events_per_click // 2)
+    size = ctypes.sizeof(_INPUT)
+    be = _Backend.resolve()
+    failsafe = pyautogui.FAILSAFE
+    failsafe_points = set(map(tuple, pyautogui.FAILSAFE_POINTS))
+    
+    def burst(n):
+        if failsafe and tuple(be.pos()) in failsafe_points:
+            raise pyautogui.FailSafeException("Mouse moved to a fail-safe corner")
+        send_input(n * events_per_click, events, size)
+    
+    return burst
+
+
+def _load_pyautogui():
+    """Import and configure pyautogui on first use.
+
+    Raises ImportError if pyautogui is not installed.
+    """
+    global pyautogui
+    if pyautogui is None:
+        import pyautogui as module
+        
+        # pyautogui sleeps PAUSE seconds after every call and enforces minimum
+        # durations for tweens. Never set PAUSE > 0; see pyautogui #568.
+        module.PAUSE = 0
+        module.FAILSAFE = True
+        module.MINIMUM_DURATION = 0
+        module.MINIMUM_SLEEP = 0
+        pyautogui = module
+    return pyautogui
 
 
 class AutoClickerGUI:
@@ -30,16 +359,20 @@ class AutoClickerGUI:
         
         # Clicking state
         self.is_clicking = False
-        self.click_thread = None
-        
-        # Check if pyautogui is available
-        if pyautogui is None:
-            self.show_dependency_error()
+        self._click_after_id = None
+        self._flush_after_id = None
+        self._do_click = None
+        self._do_burst = None
+        self._period = 0.0
+        self._deadline = 0.0
+        self._max_clicks = 0
+        self._click_count = 0
+        self._session = contextlib.ExitStack()
     
     def setup_window(self):
         """Configure the main window properties."""
         self.root.title("Auto Clicker")
-        self.root.geometry("400x700")
+        self.root.geometry("400x770")
         self.root.resizable(False, False)
         
         # Set window icon and styling based on platform
@@ -65,6 +398,8 @@ class AutoClickerGUI:
         self.infinite_var = tk.BooleanVar(value=True)
         self.mouse_button_var = tk.StringVar(value="left")
         self.click_type_var = tk.StringVar(value="single")
+        self.compat_mode_var = tk.BooleanVar(value=False)
+        self.burst_mode_var = tk.BooleanVar(value=False)
         self.status_var = tk.StringVar(value="Ready")
         self.total_clicks_var = tk.IntVar(value=0)
     
@@ -172,9 +507,34 @@ class AutoClickerGUI:
             value="double"
         ).grid(row=0, column=1, sticky=tk.W)
         
+        # Options section
+        options_frame = ttk.LabelFrame(main_frame, text="Options", padding="10")
+        options_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Checkbutton(
+            options_frame, 
+            text="Compatibility mode (slower, full pyautogui clicks)", 
+            variable=self.compat_mode_var
+        ).grid(row=0, column=0, sticky=tk.W)
+        
+        if sys.platform == "win32":
+            ttk.Checkbutton(
+                options_frame, 
+                text=f"Burst mode (batch clicks above {BURST_MIN_CPS} CPS)", 
+                variable=self.burst_mode_var
+            ).grid(row=1, column=0, sticky=tk.W)
+        
+        # Settings are read once when clicking starts, so lock them meanwhile
+        self.settings_widgets = [
+            child
+            for frame in (cps_frame, count_frame, button_frame, type_frame, options_frame)
+            for child in frame.winfo_children()
+            if not isinstance(child, ttk.Label)
+        ]
+        
         # Control buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=5, column=0, columnspan=2, pady=(20, 10))
+        button_frame.grid(row=6, column=0, columnspan=2, pady=(20, 10))
         
         self.start_button = ttk.Button(
             button_frame, 
@@ -194,7 +554,7 @@ class AutoClickerGUI:
         
         # Status section
         status_frame = ttk.LabelFrame(main_frame, text="Status", padding="10")
-        status_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        status_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         
         ttk.Label(status_frame, text="Status:").grid(row=0, column=0, sticky=tk.W)
         status_label = ttk.Label(status_frame, textvariable=self.status_var)
@@ -211,7 +571,7 @@ class AutoClickerGUI:
             justify=tk.LEFT,
             font=("Arial", 9)
         )
-        instructions.grid(row=7, column=0, columnspan=2, pady=(20, 0))
+        instructions.grid(row=8, column=0, columnspan=2, pady=(20, 0))
         
         # Configure grid weights
         main_frame.columnconfigure(0, weight=1)
@@ -221,10 +581,22 @@ class AutoClickerGUI:
     
     def setup_bindings(self):
         """Set up keyboard bindings."""
-        self.root.bind('<F6>', lambda e: self.toggle_clicking())
-        self.root.bind('<Escape>', lambda e: self.stop_clicking())
+        # Bindings on the root window also fire for every child widget, but
+        # not inside Tk dialogs such as message boxes
+        self.root.bind('<F6>', self._on_f6)
+        self.root.bind('<Escape>', self._on_escape)
         self.root.focus_set()  # Allow window to receive key events
     
+    def _on_f6(self, _event):
+        """Handle the F6 shortcut."""
+        self.toggle_clicking()
+        return "break"
+    
+    def _on_escape(self, _event):
+        """Handle the ESC shortcut."""
+        self.stop_clicking()
+        return "break"
+    
     def toggle_click_count(self):
         """Toggle the click count spinbox state."""
         if self.infinite_var.get():
@@ -232,6 +604,15 @@ class AutoClickerGUI:
         else:
             self.count_spinbox.configure(state="normal")
     
+    def set_settings_state(self, state):
+        """Enable or disable all settings widgets."""
+        for widget in self.settings_widgets:
+            widget.configure(state=state)
+        
+        # Restore the click count spinbox to match the selected mode
+        if state == "normal":
+            self.toggle_click_count()
+    
     def show_dependency_error(self):
         """Show error message if pyautogui is not installed."""
         messagebox.showerror(
@@ -240,15 +621,15 @@ class AutoClickerGUI:
             "Please install it using:\npip install pyautogui"
         )
     
+    def _report_error(self, message):
+        """Show an error that stopped the clicking session."""
+        messagebox.showerror(
+            "Error", 
+            f"An error occurred during clicking: {message}"
+        )
+    
     def validate_settings(self):
         """Validate user settings before starting."""
-        if pyautogui is None:
-            messagebox.showerror(
-                "Error", 
-                "pyautogui is not installed. Please install it first."
-            )
-            return False
-        
         if self.cps_var.get() <= 0:
             messagebox.showerror("Error", "Clicks per second must be greater than 0")
             return False
@@ -257,6 +638,13 @@ class AutoClickerGUI:
             messagebox.showerror("Error", "Click count must be greater than 0")
             return False
         
+        # Deferred until now so opening the window doesn't pay for it
+        try:
+            _load_pyautogui()
+        except ImportError:
+            self.show_dependency_error()
+            return False
+        
         return True
     
     def start_clicking(self):
@@ -267,15 +655,44 @@ class AutoClickerGUI:
         if self.is_clicking:
             return
         
+        # Snapshot the settings and build the click actions before touching
+        # the UI, so a failure here leaves the window ready to start again
+        cps = self.cps_var.get()
+        button = self.mouse_button_var.get()
+        is_double = self.click_type_var.get() == "double"
+        compat_mode = self.compat_mode_var.get()
+        try:
+            do_click = _make_click_action(button, is_double, compat_mode)
+            do_burst = None
+            if self.burst_mode_var.get() and not compat_mode and cps > BURST_MIN_CPS:
+                do_burst = _make_burst_action(button, is_double)
+        except Exception as e:
+            self._report_error(str(e))
+            return
+        
+        self._period = 1.0 / cps
+        self._do_click = do_click
+        self._do_burst = do_burst
+        self._max_clicks = self.click_count_var.get() if not self.infinite_var.get() else float('inf')
+        self._click_count = 0
+        
+        # The widgets are locked while clicking
         self.is_clicking = True
         self.start_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
+        self.set_settings_state("disabled")
         self.status_var.set("Clicking...")
         self.total_clicks_var.set(0)
         
-        # Start clicking in a separate thread
-        self.click_thread = threading.Thread(target=self.click_worker, daemon=True)
-        self.click_thread.start()
+        # Clicks are driven by the Tk event loop rather than a worker thread;
+        # a click only takes a fraction of a scheduler tick, so the GUI stays
+        # responsive and no Tk state is touched from another thread. The
+        # counter refresh is armed first, as the first click may already end
+        # the session and cancel it.
+        self._session.enter_context(_high_res_timer())
+        self._flush_after_id = self.root.after(UI_REFRESH_MS, self._flush_count)
+        self._deadline = time.perf_counter()
+        self._schedule_next_click()
     
     def stop_clicking(self):
         """Stop the auto-clicking process."""
@@ -283,9 +700,26 @@ class AutoClickerGUI:
             return
         
         self.is_clicking = False
+        if self._click_after_id is not None:
+            self.root.after_cancel(self._click_after_id)
+            self._click_after_id = None
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        self._session.close()
+        
         self.start_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
+        self.set_settings_state("normal")
         self.status_var.set("Stopped")
+        self.total_clicks_var.set(self._click_count)
+    
+    def _flush_count(self):
+        """Refresh the click counter label at a bounded rate."""
+        self._flush_after_id = None
+        self.total_clicks_var.set(self._click_count)
+        if self.is_clicking:
+            self._flush_after_id = self.root.after(UI_REFRESH_MS, self._flush_count)
     
     def toggle_clicking(self):
         """Toggle between start and stop clicking."""
@@ -294,46 +728,51 @@ class AutoClickerGUI:
         else:
             self.start_clicking()
     
-    def click_worker(self):
-        """Worker thread for performing clicks."""
-        if pyautogui is None:
-            return
-        
-        # Set pyautogui settings
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0
-        
-        delay = 1.0 / self.cps_var.get()
-        click_count = 0
-        max_clicks = self.click_count_var.get() if not self.infinite_var.get() else float('inf')
+    def _schedule_next_click(self):
+        """Perform one click and schedule the next one on the Tk event loop."""
+        self._click_after_id = None
         
+        clicks = 1
         try:
-            while self.is_clicking and click_count < max_clicks:
-                # Perform the click
-                if self.click_type_var.get() == "single":
-                    pyautogui.click(button=self.mouse_button_var.get())
-                else:  # double click
-                    pyautogui.doubleClick(button=self.mouse_button_var.get())
-                
-                click_count += 1
-                self.total_clicks_var.set(click_count)
-                
-                # Wait for the specified delay
-                time.sleep(delay)
-                
+            if self._do_burst is not None:
+                clicks = min(BURST_SIZE, self._max_clicks - self._click_count)
+                self._do_burst(clicks)
+            else:
+                self._do_click()
         except pyautogui.FailSafeException:
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.stop_clicking()
+            # Show the dialog once this callback has returned, not from
+            # inside it; after() passes the arguments without a lambda
+            self.root.after(
+                0, 
+                messagebox.showinfo, 
                 "Fail-safe Triggered", 
                 "Auto-clicking stopped due to mouse moved to corner (fail-safe)."
-            ))
+            )
+            return
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror(
-                "Error", 
-                f"An error occurred during clicking: {str(e)}"
-            ))
-        finally:
-            # Update UI in main thread
-            self.root.after(0, self.stop_clicking)
+            self.stop_clicking()
+            self.root.after(0, self._report_error, str(e))
+            return
+        
+        self._click_count += clicks
+        if self._click_count >= self._max_clicks:
+            self.stop_clicking()
+            return
+        
+        # Schedule against absolute deadlines so the time spent inside
+        # the click call doesn't accumulate as drift.
+        interval = self._period * clicks
+        self._deadline += interval
+        delay = self._deadline - time.perf_counter()
+        if delay < -interval:
+            # Fell a whole period behind; resync instead of bursting
+            # clicks to catch up
+            self._deadline = time.perf_counter()
+        
+        self._click_after_id = self.root.after(
+            max(0, round(delay * 1000)), self._schedule_next_click
+        )
     
     def run(self):
         """Start the GUI application."""
@@ -4,14 +4,82 @@ Build script for creating executable versions of the Auto Clicker application.
 Supports macOS, Linux, and Windows using PyInstaller.
 """
 
+import collections
+import importlib.util
 import os
 import sys
 import subprocess
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Number of PyInstaller output lines repeated when a build fails
+BUILD_LOG_TAIL_LINES = 200
+
+# PyInstaller spec file, filled in by ExecutableBuilder.create_spec_file()
+_SPEC_TEMPLATE = '''# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(
+    ['{source}'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='{name}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+'''
+
+# App bundle section appended to the spec on macOS
+_BUNDLE_TEMPLATE = '''
+app = BUNDLE(
+    exe,
+    name='{name}.app',
+    icon=None,
+    bundle_identifier='com.autoclicker.app',
+    info_plist={{
+        'NSHighResolutionCapable': 'True',
+        'NSAppleEventsUsageDescription': 'This app needs to send mouse clicks.',
+        'NSAccessibilityUsageDescription': 'This app needs accessibility permission to click.',
+    }},
+)
+'''
+
+
 class ExecutableBuilder:
     """Class to handle building executables for different platforms."""
     
@@ -44,17 +112,20 @@ class ExecutableBuilder:
                 "additional_args": ["--windowed", "--onefile"]
             }
         }
+        self.config = self.platform_configs.get(self.current_platform, self.platform_configs["Linux"])
     
     def check_dependencies(self):
         """Check if required dependencies are installed."""
-        required_packages = ["pyinstaller", "pyautogui"]
+        # Map pip package names to their importable module names
+        required_packages = {"pyinstaller": "PyInstaller", "pyautogui": "pyautogui"}
         missing_packages = []
         
-        for package in required_packages:
-            try:
-                __import__(package)
+        for package, module in required_packages.items():
+            # find_spec only locates the module; importing pyautogui would
+            # pull in PIL, pyscreeze and a display connection
+            if importlib.util.find_spec(module) is not None:
                 print(f"✓ {package} is installed")
-            except ImportError:
+            else:
                 missing_packages.append(package)
                 print(f"✗ {package} is missing")
         
@@ -77,77 +148,37 @@ class ExecutableBuilder:
     
     def clean_build_directories(self):
         """Clean previous build directories."""
-        for directory in [self.build_dir, self.dist_dir]:
-            if directory.exists():
-                print(f"Cleaning {directory}")
-                shutil.rmtree(directory)
+        directories = [d for d in (self.build_dir, self.dist_dir) if d.exists()]
+        if not directories:
+            return
+        
+        for directory in directories:
+            print(f"Cleaning {directory}")
+        
+        # Both trees hold thousands of small files; remove them concurrently
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            list(executor.map(shutil.rmtree, directories))
+    
+    def get_output_path(self):
+        """Return the path of the executable PyInstaller produces."""
+        return self.dist_dir / f"{self.config['name']}{self.config['extension']}"
+    
+    def is_up_to_date(self):
+        """Check if the existing executable is newer than the source file."""
+        output = self.get_output_path()
+        if not output.exists():
+            return False
+        return output.stat().st_mtime > self.source_file.stat().st_mtime
     
     def create_spec_file(self):
         """Create a PyInstaller spec file with custom configuration."""
-        config = self.platform_configs.get(self.current_platform, self.platform_configs["Linux"])
-        
-        spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['{self.source_file}'],
-    pathex=[],
-    binaries=[],
-    datas=[],
-    hiddenimports=[],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='{config["name"]}',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-'''
+        spec_content = _SPEC_TEMPLATE.format(source=self.source_file, name=self.config["name"])
         
         # Add app bundle for macOS
         if self.current_platform == "Darwin":
-            spec_content += f'''
-app = BUNDLE(
-    exe,
-    name='{config["name"]}.app',
-    icon=None,
-    bundle_identifier='com.autoclicker.app',
-    info_plist={{
-        'NSHighResolutionCapable': 'True',
-        'NSAppleEventsUsageDescription': 'This app needs to send mouse clicks.',
-        'NSAccessibilityUsageDescription': 'This app needs accessibility permission to click.',
-    }},
-)
-'''
+            spec_content += _BUNDLE_TEMPLATE.format(name=self.config["name"])
         
-        spec_file = self.script_dir / f"{config['name']}.spec"
+        spec_file = self.script_dir / f"{self.config['name']}.spec"
         with open(spec_file, 'w') as f:
             f.write(spec_content)
         
@@ -155,8 +186,6 @@ app = BUNDLE(
     
     def build_executable(self):
         """Build the executable using PyInstaller."""
-        config = self.platform_configs.get(self.current_platform, self.platform_configs["Linux"])
-        
         # Create spec file
         spec_file = self.create_spec_file()
         
@@ -172,15 +201,30 @@ app = BUNDLE(
         print(f"Command: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(cmd, cwd=self.script_dir, capture_output=True, text=True)
+            # Stream the output as it arrives, keeping only the tail in
+            # memory for the failure summary
+            tail = collections.deque(maxlen=BUILD_LOG_TAIL_LINES)
+            with subprocess.Popen(
+                cmd,
+                cwd=self.script_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                bufsize=1
+            ) as process:
+                for line in process.stdout:
+                    print(line, end='')
+                    tail.append(line)
+            returncode = process.returncode
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("✓ Build successful!")
                 return True
             else:
                 print("✗ Build failed!")
-                print("STDOUT:", result.stdout)
-                print("STDERR:", result.stderr)
+                print(f"Last {len(tail)} lines of output:")
+                print(''.join(tail), end='')
                 return False
                 
         except FileNotFoundError:
@@ -192,8 +236,7 @@ app = BUNDLE(
     
     def post_build_actions(self):
         """Perform post-build actions."""
-        config = self.platform_configs[self.current_platform]
-        expected_output = self.dist_dir / f"{config['name']}{config['extension']}"
+        expected_output = self.get_output_path()
         
         if expected_output.exists():
             print(f"✓ Executable created: {expected_output}")
@@ -231,18 +274,23 @@ app = BUNDLE(
     
     def create_requirements_file(self):
         """Create a requirements.txt file for dependencies."""
+        requirements_file = self.script_dir / "requirements.txt"
+        if requirements_file.exists():
+            # Keep the pinned, hash-locked file generated from requirements.in
+            print("✓ Using existing requirements.txt")
+            return
+        
         requirements = [
             "pyautogui>=0.9.50",
             "pyinstaller>=5.0.0"
         ]
         
-        requirements_file = self.script_dir / "requirements.txt"
         with open(requirements_file, 'w') as f:
             f.write('\n'.join(requirements))
         
         print(f"✓ Created requirements.txt")
     
-    def build(self):
+    def build(self, force=False):
         """Main build process."""
         print("=" * 50)
         print("Auto Clicker - Executable Builder")
@@ -259,6 +307,11 @@ app = BUNDLE(
         if not self.check_source_file():
             return False
         
+        # Skip the build if nothing changed since the last one
+        if not force and self.is_up_to_date():
+            print(f"✓ {self.get_output_path()} is up to date (use --force to rebuild)")
+            return True
+        
         # Clean previous builds
         self.clean_build_directories()
         
@@ -337,6 +390,8 @@ def main():
                        help="Create platform-specific build scripts")
     parser.add_argument("--clean", action="store_true",
                        help="Clean build directories only")
+    parser.add_argument("--force", action="store_true",
+                       help="Rebuild even if the executable is up to date")
     
     args = parser.parse_args()
     
@@ -356,7 +411,7 @@ def main():
         return
     
     # Run the build process
-    success = builder.build()
+    success = builder.build(force=args.force)
     sys.exit(0 if success else 1)
 
 
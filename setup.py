@@ -4,17 +4,67 @@ Setup script for Auto Clicker application.
 Handles installation, dependency management, and build preparation.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
 import os
+import shutil
 import sys
 import subprocess
+import tarfile
+import venv
 import platform
 from pathlib import Path
 
 
+# Project directory, resolved once for every path built below
+CWD = Path.cwd()
+MAIN_SCRIPT = str(CWD / "auto_clicker.py")
+
+# pip releases older than this get upgraded before installing dependencies
+MIN_PIP_VERSION = (23, 0)
+
+# Persistent wheel cache so repeated setup runs don't download again
+PIP_CACHE_DIR = Path.home() / ".cache" / "autoclicker-pip"
+
+# Snapshots of fully installed virtual environments, see venv_cache_path()
+VENV_CACHE_DIR = Path.home() / ".cache" / "autoclicker-venvs"
+
+# Packages whose source builds compile native code (PyInstaller's
+# bootloader), so installs insist on a wheel first instead of stalling on a
+# compile. pyautogui and its helpers only ship sdists, so they can't be
+# restricted the same way.
+BINARY_ONLY_PACKAGES = ["pyinstaller"]
+
+# Pinned, hash-checked lock generated from requirements.in, and the oldest
+# Python it was resolved for
+REQUIREMENTS_LOCK = "requirements.txt"
+LOCK_MIN_PYTHON = (3, 8)
+
+# Required packages, mapped to the module name they are imported as
+REQUIRED_PACKAGES = {
+    "pyautogui": "pyautogui",
+    "pyinstaller": "PyInstaller"
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _system():
+    """Host OS name ("Windows", "Darwin", "Linux", ...), looked up once."""
+    return platform.system()
+
+
+@functools.lru_cache(maxsize=None)
+def _py_version_ok():
+    """Whether this interpreter is new enough to run the application."""
+    return sys.version_info >= (3, 7)
+
+
 def check_python_version():
     """Check if Python version is compatible."""
-    if sys.version_info < (3, 6):
-        print("✗ Python 3.6 or higher is required")
+    if not _py_version_ok():
+        print("✗ Python 3.7 or higher is required")
         print(f"  Current version: {sys.version}")
         return False
     
@@ -22,112 +72,477 @@ def check_python_version():
     return True
 
 
-def install_package(package_name, upgrade=False):
-    """Install a Python package using pip."""
-    cmd = [sys.executable, "-m", "pip", "install"]
+def current_pip_version():
+    """Return the installed pip's (major, minor) version, or None."""
+    try:
+        import pip
+        return tuple(int(part) for part in pip.__version__.split(".")[:2])
+    except (ImportError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def find_uv():
+    """Return the path of the uv binary if it is on PATH, else None."""
+    return shutil.which("uv")
+
+
+def install_command():
+    """Return the command prefix used to install packages.
+
+    uv is a much faster drop-in for pip (parallel downloads, faster
+    resolver), so it is used whenever available; it is pointed at this
+    interpreter so packages land in the same environment pip would use.
+    """
+    uv = find_uv()
+    if uv:
+        # uv always picks a wheel over an sdist when one exists, and keeps
+        # its own persistent global cache
+        return [uv, "pip", "install", "-q", "--python", sys.executable]
+    # Skip pip's self-version check (a request to PyPI) and its prompts
+    return [sys.executable, "-m", "pip", "--disable-pip-version-check",
+            "--no-input", "install", "-q",
+            "--cache-dir", str(PIP_CACHE_DIR), "--prefer-binary"]
+
+
+def build_install_command(packages, upgrade=False, binary_only=True,
+                          requirements=None):
+    """Build the pip (or uv) command line for installing packages.
+
+    Returns the command and whether it restricts how packages may be
+    built, in which case a missing-wheel failure is worth retrying
+    without those restrictions.
+    """
+    cmd = install_command()
     
     if upgrade:
         cmd.append("--upgrade")
     
-    cmd.append(package_name)
+    restricted = False
+    if binary_only:
+        wheels_only = [p for p in packages if p in BINARY_ONLY_PACKAGES]
+        if wheels_only:
+            cmd.append(f"--only-binary={','.join(wheels_only)}")
+            restricted = True
+        # Building sdists in an isolated env downloads setuptools each time;
+        # reuse the installed build tools when they are present
+        if all(importlib.util.find_spec(m) for m in ("setuptools", "wheel")):
+            cmd.append("--no-build-isolation")
+            restricted = True
     
-    try:
-        subprocess.check_call(cmd)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    if requirements is not None:
+        cmd.extend(["--require-hashes", "-r", str(requirements)])
+    else:
+        cmd.extend(packages)
+    
+    return cmd, restricted
+
+
+def install_env():
+    """Environment for installer processes.
+
+    Also covers any pip processes spawned by the install (build steps).
+    """
+    return dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1",
+                PIP_PROGRESS_BAR="off")
+
+
+def install_package(packages, upgrade=False, binary_only=True,
+                    requirements=None):
+    """Install Python packages with a single pip (or uv) invocation.
+
+    Returns the list of packages that failed to install (empty on success).
+    """
+    cmd, restricted = build_install_command(packages, upgrade, binary_only,
+                                            requirements)
+    
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=install_env()
+    )
+    if result.returncode == 0:
+        return []
+    
+    if restricted and is_missing_wheel_error(result.stderr):
+        print("  No matching wheel found, retrying with source builds allowed...")
+        return install_package(packages, upgrade, binary_only=False,
+                               requirements=requirements)
+    
+    print(result.stderr, end="")
+    return find_failed_packages(result.stderr, packages)
+
+
+async def install_package_async(packages, binary_only=True):
+    """Asyncio counterpart of install_package, for running several at once.
+
+    Returns the list of packages that failed to install (empty on success).
+    """
+    cmd, restricted = build_install_command(packages, binary_only=binary_only)
+    
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=install_env()
+    )
+    _, stderr = await process.communicate()
+    if process.returncode == 0:
+        return []
+    
+    stderr = stderr.decode(errors="replace")
+    if restricted and is_missing_wheel_error(stderr):
+        print("  No matching wheel found, retrying with source builds allowed...")
+        return await install_package_async(packages, binary_only=False)
+    
+    print(stderr, end="")
+    return find_failed_packages(stderr, packages)
+
+
+def install_package_from_requirements(requirements, packages):
+    """Install the pinned, hash-locked requirements file.
+
+    Returns None if the lock doesn't cover this interpreter, otherwise the
+    list of packages that failed to install (empty on success).
+    """
+    for binary_only in (True, False):
+        cmd, restricted = build_install_command(packages,
+                                                binary_only=binary_only,
+                                                requirements=requirements)
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=install_env()
+        )
+        if result.returncode == 0:
+            return []
+        if not is_missing_wheel_error(result.stderr):
+            break
+        if not restricted:
+            return None
+    
+    # Anything else, a hash mismatch included, is a real failure
+    print(result.stderr, end="")
+    return find_failed_packages(result.stderr, packages)
+
+
+def is_missing_wheel_error(pip_stderr):
+    """Check if an install failed only because no acceptable wheel exists."""
+    text = pip_stderr.lower()
+    return any(marker in text for marker in (
+        "no matching distribution",  # pip
+        "no usable wheels",          # uv
+        "no wheels with a matching"  # uv
+    ))
+
+
+def find_failed_packages(pip_stderr, packages):
+    """Work out which packages a failed pip run is complaining about.
+
+    pip names the offending requirement in its ERROR lines, uv in its
+    "error:"/"Because ..." lines. If none of the packages can be matched,
+    all of them are reported as failed.
+    """
+    error_lines = [
+        line for line in (
+            raw.lower().lstrip(" ×╰─▶") for raw in pip_stderr.splitlines()
+        )
+        if line.startswith(("error", "because"))
+    ]
+    failed = [
+        package for package in packages
+        if any(package.lower() in line for line in error_lines)
+    ]
+    return failed or list(packages)
+
+
+def install_packages_concurrently(packages):
+    """Install each package in its own pip process, all in parallel.
+
+    Used when a batched install fails, so one bad package doesn't stop the
+    others from installing. The processes are driven from a single asyncio
+    event loop rather than a thread each. Returns the list of packages
+    that failed.
+    """
+    async def install_all():
+        """Run every install at once and collect their results."""
+        return await asyncio.gather(*(
+            install_package_async([package]) for package in packages
+        ))
+    
+    if _system() == "Windows" and sys.version_info < (3, 8):
+        # Only the proactor loop supports subprocesses on Windows, and it
+        # became the default in 3.8
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    results = asyncio.run(install_all())
+    return [package for package, failed in zip(packages, results) if failed]
+
+
+def flush_log(log_buf):
+    """Write buffered status lines to stdout in one go and clear the buffer."""
+    if log_buf:
+        sys.stdout.write("\n".join(log_buf) + "\n")
+        sys.stdout.flush()
+        log_buf.clear()
 
 
 def install_dependencies():
     """Install all required dependencies."""
-    print("Installing dependencies...")
+    log_buf = ["Installing dependencies..."]
     
-    # Upgrade pip first
-    print("  Upgrading pip...")
-    if not install_package("pip", upgrade=True):
-        print("  ⚠ Failed to upgrade pip, continuing anyway...")
+    # Only run the installer for packages that aren't importable already
+    packages = []
+    for package, module in REQUIRED_PACKAGES.items():
+        if importlib.util.find_spec(module) is None:
+            packages.append(package)
+        else:
+            log_buf.append(f"  ✓ {package} is already installed")
     
-    # Required packages
-    packages = [
-        "pyautogui",
-        "pyinstaller"
-    ]
+    if not packages:
+        log_buf.append("✓ All dependencies installed successfully")
+        flush_log(log_buf)
+        cache_virtual_environment()
+        return True
+    
+    # Upgrade pip first, unless it is already recent enough or uv is
+    # doing the installing
+    pip_version = current_pip_version()
+    if find_uv():
+        log_buf.append("  ✓ Using uv to install packages")
+    elif pip_version is not None and pip_version >= MIN_PIP_VERSION:
+        log_buf.append(f"  ✓ pip {'.'.join(map(str, pip_version))} is up to date")
+    else:
+        log_buf.append("  Upgrading pip...")
+        flush_log(log_buf)
+        if install_package(["pip"], upgrade=True):
+            print("  ⚠ Failed to upgrade pip, continuing anyway...")
+    
+    # One pip run resolves and downloads everything together instead of
+    # paying interpreter startup and index lookups once per package
+    log_buf.append(f"  Installing {', '.join(packages)}...")
+    flush_log(log_buf)
+    failed_packages = None
+    lock_file = CWD / REQUIREMENTS_LOCK
+    if lock_file.exists() and sys.version_info >= LOCK_MIN_PYTHON:
+        failed_packages = install_package_from_requirements(lock_file, packages)
+        if failed_packages:
+            # Installing unverified packages instead would defeat the lock
+            print("\n✗ Locked install failed (see the errors above)")
+            print(f"Check {REQUIREMENTS_LOCK} or regenerate it from requirements.in")
+            return False
     
-    failed_packages = []
+    if failed_packages is None:
+        if lock_file.exists():
+            print("  ⚠ Locked requirements don't cover this Python, "
+                  "installing unpinned packages instead...")
+        failed_packages = install_package(packages)
+    
+    if failed_packages and len(packages) > 1:
+        # pip installs nothing when any requirement in the batch fails, so
+        # retry each package on its own to install the ones that can be
+        print("  Retrying packages individually...")
+        failed_packages = install_packages_concurrently(packages)
     
     for package in packages:
-        print(f"  Installing {package}...")
-        if install_package(package):
-            print(f"  ✓ {package} installed successfully")
+        if package in failed_packages:
+            log_buf.append(f"  ✗ Failed to install {package}")
         else:
-            print(f"  ✗ Failed to install {package}")
-            failed_packages.append(package)
+            log_buf.append(f"  ✓ {package} installed successfully")
     
     if failed_packages:
-        print(f"\n✗ Failed to install: {', '.join(failed_packages)}")
-        print("Please try installing them manually:")
+        log_buf.append(f"\n✗ Failed to install: {', '.join(failed_packages)}")
+        log_buf.append("Please try installing them manually:")
         for package in failed_packages:
-            print(f"  pip install {package}")
+            log_buf.append(f"  pip install {package}")
+        flush_log(log_buf)
         return False
     
-    print("✓ All dependencies installed successfully")
+    log_buf.append("✓ All dependencies installed successfully")
+    flush_log(log_buf)
+    cache_virtual_environment()
     return True
 
 
+def _mac_notes():
+    """Print setup notes for macOS."""
+    print("macOS detected - you may need to:")
+    print("  1. Grant accessibility permissions to Python/Terminal")
+    print("  2. Install Xcode Command Line Tools if not already installed")
+
+
+def _linux_notes():
+    """Print setup notes for Linux."""
+    print("Linux detected - you may need to:")
+    print("  1. Install python3-tk: sudo apt-get install python3-tk")
+    print("  2. Install xdotool: sudo apt-get install xdotool")
+
+
+def _win_notes():
+    """Print setup notes for Windows."""
+    print("Windows detected - should work out of the box")
+    print("  Note: Windows Defender might flag the executable as suspicious")
+
+
+def _unknown_notes():
+    """Print a warning for an untested platform."""
+    print(f"Unknown platform: {_system()}")
+    print("  The application may still work, but hasn't been tested")
+
+
+_PLATFORM_NOTES = {
+    "Darwin": _mac_notes,
+    "Linux": _linux_notes,
+    "Windows": _win_notes,
+}
+
+
 def check_platform_requirements():
     """Check platform-specific requirements."""
-    system = platform.system()
+    _PLATFORM_NOTES.get(_system(), _unknown_notes)()
+
+
+def run_venv_creator(venv_path):
+    """Create a virtual environment with the fastest tool available.
+
+    The stdlib venv runs ensurepip, which is slow (especially on Windows);
+    uv and virtualenv copy a cached pip wheel instead. Returns the name of
+    the tool used.
+    """
+    uv = find_uv()
+    if uv:
+        try:
+            # --seed installs pip too, matching what venv provides; pin the
+            # running interpreter rather than whichever Python uv finds first
+            subprocess.check_call([uv, "venv", "--seed", "--python",
+                                   sys.executable, str(venv_path)])
+            return "uv"
+        except (OSError, subprocess.CalledProcessError):
+            pass
     
-    if system == "Darwin":  # macOS
-        print("macOS detected - you may need to:")
-        print("  1. Grant accessibility permissions to Python/Terminal")
-        print("  2. Install Xcode Command Line Tools if not already installed")
-        
-    elif system == "Linux":
-        print("Linux detected - you may need to:")
-        print("  1. Install python3-tk: sudo apt-get install python3-tk")
-        print("  2. Install xdotool: sudo apt-get install xdotool")
-        
-    elif system == "Windows":
-        print("Windows detected - should work out of the box")
-        print("  Note: Windows Defender might flag the executable as suspicious")
-        
-    else:
-        print(f"Unknown platform: {system}")
-        print("  The application may still work, but hasn't been tested")
+    if importlib.util.find_spec("virtualenv") is not None:
+        try:
+            subprocess.check_call([sys.executable, "-m", "virtualenv", str(venv_path)])
+            return "virtualenv"
+        except subprocess.CalledProcessError:
+            pass
+    
+    builder = venv.EnvBuilder(system_site_packages=False, with_pip=True,
+                              symlinks=(os.name != "nt"))
+    builder.create(str(venv_path))
+    return "venv"
+
+
+def venv_cache_path(venv_path):
+    """Return the snapshot archive for a venv at venv_path.
+
+    Virtual environments hard-code their interpreter and location, so the
+    key covers the Python version, the venv path, the package list and the
+    requirements lock.
+    """
+    lock_file = CWD / REQUIREMENTS_LOCK
+    lock_digest = hashlib.sha1(lock_file.read_bytes()).hexdigest() if lock_file.exists() else ""
+    key_source = "|".join([
+        sys.version,
+        str(venv_path.resolve()),
+        ",".join(REQUIRED_PACKAGES),
+        lock_digest
+    ])
+    key = hashlib.sha1(key_source.encode()).hexdigest()[:12]
+    return VENV_CACHE_DIR / f"{key}.tar"
+
+
+def cache_virtual_environment():
+    """Snapshot the project venv after dependencies were installed into it.
+
+    Does nothing unless this script is running inside the project venv or
+    a snapshot already exists.
+    """
+    venv_path = CWD / "venv"
+    if not venv_path.exists() or Path(sys.prefix).resolve() != venv_path.resolve():
+        return
+    
+    cache = venv_cache_path(venv_path)
+    if cache.exists():
+        return
+    
+    try:
+        VENV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        partial = cache.with_suffix(".tmp")
+        with tarfile.open(partial, "w") as tar:
+            tar.add(venv_path, arcname=".")
+        partial.replace(cache)
+        print(f"✓ Cached virtual environment: {cache}")
+    except OSError as e:
+        print(f"⚠ Could not cache virtual environment: {e}")
+
+
+def restore_virtual_environment(cache, venv_path):
+    """Unpack a venv snapshot created by cache_virtual_environment().
+
+    The snapshot is unpacked next to venv_path and renamed into place, so a
+    failed restore never leaves a half-populated venv behind.
+    """
+    # Venvs contain absolute interpreter symlinks, which the "data" filter
+    # rejects; the archive is our own, so extract it as fully trusted
+    extract_args = {"filter": "fully_trusted"} if hasattr(tarfile, "fully_trusted_filter") else {}
+    partial = venv_path.with_name(venv_path.name + ".tmp")
+    shutil.rmtree(partial, ignore_errors=True)
+    try:
+        with tarfile.open(cache) as tar:
+            tar.extractall(partial, **extract_args)
+        partial.rename(venv_path)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
 
 
 def create_virtual_environment():
-    """Create a virtual environment for the project."""
-    venv_path = Path.cwd() / "venv"
+    """Create a virtual environment for the project.
+
+    Returns "exists", "restored" (from a snapshot, with dependencies
+    installed) or "created", or None on failure.
+    """
+    venv_path = CWD / "venv"
     
     if venv_path.exists():
         print("✓ Virtual environment already exists")
-        return True
+        return "exists"
     
-    print("Creating virtual environment...")
+    cache = venv_cache_path(venv_path)
     
     try:
-        subprocess.check_call([sys.executable, "-m", "venv", "venv"])
-        print("✓ Virtual environment created")
+        if cache.exists():
+            print("Restoring virtual environment from cache...")
+            restore_virtual_environment(cache, venv_path)
+            print(f"✓ Virtual environment restored from {cache}")
+            status = "restored"
+        else:
+            print("Creating virtual environment...")
+            tool = run_venv_creator(venv_path)
+            print(f"✓ Virtual environment created (using {tool})")
+            status = "created"
         
         # Determine activation script path
-        if platform.system() == "Windows":
+        if _system() == "Windows":
             activate_script = venv_path / "Scripts" / "activate.bat"
         else:
             activate_script = venv_path / "bin" / "activate"
         
         print(f"To activate the virtual environment, run:")
-        if platform.system() == "Windows":
+        if _system() == "Windows":
             print(f"  {activate_script}")
         else:
             print(f"  source {activate_script}")
         
-        return True
+        return status
         
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError, tarfile.TarError) as e:
         print(f"✗ Failed to create virtual environment: {e}")
-        return False
+        return None
 
 
 def verify_installation():
@@ -144,20 +559,14 @@ def verify_installation():
     
     # Check if pyinstaller is available
     try:
-        result = subprocess.run([sys.executable, "-m", "PyInstaller", "--version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✓ PyInstaller version: {result.stdout.strip()}")
-        else:
-            print("✗ PyInstaller not working correctly")
-            return False
-    except Exception as e:
-        print(f"✗ PyInstaller check failed: {e}")
+        import PyInstaller
+        print(f"✓ PyInstaller version: {PyInstaller.__version__}")
+    except ImportError as e:
+        print(f"✗ Failed to import PyInstaller: {e}")
         return False
     
     # Check if main script exists
-    main_script = Path.cwd() / "auto_clicker.py"
-    if main_script.exists():
+    if os.path.exists(MAIN_SCRIPT):
         print("✓ Main script found")
     else:
         print("✗ Main script (auto_clicker.py) not found")
@@ -167,43 +576,64 @@ def verify_installation():
     return True
 
 
-def create_desktop_shortcut():
-    """Create a desktop shortcut (platform-specific)."""
-    system = platform.system()
-    
-    if system == "Windows":
-        # Windows shortcut creation would require pywin32
-        print("To create a desktop shortcut on Windows:")
-        print("  1. Right-click on auto_clicker.py")
-        print("  2. Select 'Send to' > 'Desktop (create shortcut)'")
-        
-    elif system == "Darwin":  # macOS
-        print("To create a desktop shortcut on macOS:")
-        print("  1. Open Automator")
-        print("  2. Create a new 'Application'")
-        print("  3. Add 'Run Shell Script' action")
-        print(f"  4. Enter: cd '{Path.cwd()}' && python3 auto_clicker.py")
-        
-    elif system == "Linux":
-        desktop_file_content = f"""[Desktop Entry]
+def _windows_shortcut():
+    """Explain how to create a desktop shortcut on Windows."""
+    # Windows shortcut creation would require pywin32
+    print("To create a desktop shortcut on Windows:")
+    print("  1. Right-click on auto_clicker.py")
+    print("  2. Select 'Send to' > 'Desktop (create shortcut)'")
+
+
+def _mac_shortcut():
+    """Explain how to create a desktop shortcut on macOS."""
+    print("To create a desktop shortcut on macOS:")
+    print("  1. Open Automator")
+    print("  2. Create a new 'Application'")
+    print("  3. Add 'Run Shell Script' action")
+    print(f"  4. Enter: cd '{CWD}' && python3 auto_clicker.py")
+
+
+_DESKTOP_ENTRY = """[Desktop Entry]
 Version=1.0
 Type=Application
 Name=Auto Clicker
 Comment=Python Auto Clicker Application
-Exec=python3 {Path.cwd() / 'auto_clicker.py'}
+Exec=python3 {main_script}
 Icon=utilities-system-monitor
 Terminal=false
 Categories=Utility;
-"""
-        
-        desktop_file = Path.home() / "Desktop" / "AutoClicker.desktop"
+""".format(main_script=MAIN_SCRIPT).encode()
+
+
+def _linux_shortcut():
+    """Write a .desktop launcher to the user's Desktop."""
+    desktop_file = Path.home() / "Desktop" / "AutoClicker.desktop"
+    try:
+        # Write and chmod through one descriptor; the open mode alone is
+        # masked by umask and ignored for an existing file
+        fd = os.open(str(desktop_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
         try:
-            with open(desktop_file, 'w') as f:
-                f.write(desktop_file_content)
-            os.chmod(desktop_file, 0o755)
-            print(f"✓ Desktop shortcut created: {desktop_file}")
-        except Exception as e:
-            print(f"✗ Failed to create desktop shortcut: {e}")
+            os.write(fd, _DESKTOP_ENTRY)
+            os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
+        print(f"✓ Desktop shortcut created: {desktop_file}")
+    except Exception as e:
+        print(f"✗ Failed to create desktop shortcut: {e}")
+
+
+_SHORTCUT_CREATORS = {
+    "Windows": _windows_shortcut,
+    "Darwin": _mac_shortcut,
+    "Linux": _linux_shortcut,
+}
+
+
+def create_desktop_shortcut():
+    """Create a desktop shortcut (platform-specific)."""
+    creator = _SHORTCUT_CREATORS.get(_system())
+    if creator is not None:
+        creator()
 
 
 def main():
@@ -237,8 +667,12 @@ def main():
         success = install_dependencies()
         
     elif choice == "2":
-        success = create_virtual_environment()
-        if success:
+        status = create_virtual_environment()
+        success = status is not None
+        if status == "restored":
+            print("\nNote: Dependencies are already installed in the restored environment")
+            print("Activate it and run the application")
+        elif success:
             print("\nNote: Activate the virtual environment before installing dependencies")
             print("Then run this script again to install dependencies")
         